@@ -2,8 +2,6 @@ from logging import getLogger
 from os import getenv
 from typing import Dict, Optional
 
-from keyring import get_password, set_password
-from keyring.errors import KeyringError
 from requests import Response
 
 from pyinaturalist.constants import API_V0, JWT_EXPIRATION, KEYRING_KEY
@@ -110,6 +108,10 @@ def get_keyring_credentials() -> Dict[str, Optional[str]]:
     Returns:
         OAuth-compatible credentials dict
     """
+    # keyring is only imported when needed, since it takes a relatively long time to import
+    from keyring import get_password
+    from keyring.errors import KeyringError
+
     try:
         return {
             'username': get_password(KEYRING_KEY, 'username'),
@@ -137,6 +139,8 @@ def set_keyring_credentials(
         app_id: iNaturalist application ID
         app_secret: iNaturalist application secret
     """
+    from keyring import set_password
+
     set_password(KEYRING_KEY, 'username', username)
     set_password(KEYRING_KEY, 'password', password)
     set_password(KEYRING_KEY, 'app_id', app_id)
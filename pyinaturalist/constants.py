@@ -24,6 +24,9 @@ KEYRING_KEY = '/inaturalist'
 # Pagination settings
 PER_PAGE_RESULTS = 200  # Default number of records per page for paginated queries
 LARGE_REQUEST_WARNING = 5000  # Show a warning for queries that will return over this many results
+MAX_CONCURRENT_REQUESTS = 5  # Max number of concurrent requests, for pagination and file uploads
+# TODO: Just a guess; test maximum allowed IDs per request for each endpoint
+IDS_PER_REQUEST = 30  # Max number of IDs to request at once, for endpoints that accept multiple IDs
 
 # Rate-limiting and retry settings
 CONNECT_TIMEOUT = 5
@@ -35,7 +38,11 @@ REQUESTS_PER_DAY = 10000
 REQUEST_TIMEOUT = 10
 REQUEST_RETRIES = 5  # Maximum number of retries for a failed request
 RETRY_BACKOFF = 0.5  # Exponential backoff factor for retries
-RETRY_STATUSES = (500, 502, 503, 504)
+RETRY_STATUSES = (429, 500, 502, 503, 504)  # Retry-After header is used for 429 and 503
+
+# Connection pool settings
+POOL_CONNECTIONS = 10  # Number of per-host connection pools to keep
+POOL_MAXSIZE = 20  # Maximum number of reusable connections per host
 
 # HTTP methods that apply to write-only dry-run mode
 WRITE_HTTP_METHODS = ['PATCH', 'POST', 'PUT', 'DELETE']
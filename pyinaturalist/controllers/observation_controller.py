@@ -2,6 +2,7 @@ from typing import Callable, List, Optional
 
 from pyinaturalist.constants import (
     API_V1,
+    IDS_PER_REQUEST,
     V1_OBS_ORDER_BY_PROPERTIES,
     HistogramResponse,
     IntOrStr,
@@ -36,9 +37,6 @@ from pyinaturalist.v1 import (
     upload,
 )
 
-# TODO: Just a guess; test maximum allowed IDs per request
-IDS_PER_REQUEST = 30
-
 
 class ObservationController(BaseController):
     """:fa:`binoculars` Controller for Observation requests"""
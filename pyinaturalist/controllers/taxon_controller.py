@@ -1,13 +1,12 @@
 from typing import Optional
 
+from pyinaturalist.constants import IDS_PER_REQUEST
 from pyinaturalist.controllers import BaseController
 from pyinaturalist.docs import document_controller_params
 from pyinaturalist.models import Taxon
 from pyinaturalist.paginator import IDPaginator, Paginator
 from pyinaturalist.v1 import get_taxa, get_taxa_autocomplete, get_taxa_by_id
 
-IDS_PER_REQUEST = 30
-
 
 class TaxonController(BaseController):
     """:fa:`dove` Controller for Taxon requests"""
@@ -9,6 +9,7 @@ from typing import IO, Any, Dict, List, Mapping, MutableSequence, Optional, Unio
 from warnings import catch_warnings, simplefilter
 
 from dateutil.parser import UnknownTimezoneWarning  # type: ignore  # (missing from type stubs)
+from dateutil.parser import isoparse
 from dateutil.parser import parse as parse_date
 from dateutil.tz import tzlocal
 from requests import Session
@@ -50,8 +51,10 @@ def convert_all_coordinates(results: List[ResponseResult]) -> List[ResponseResul
         results: Results from API response; expects coordinates in either 'location' key or
             'latitude' and 'longitude' keys
     """
-    results = [convert_lat_long_dict(result) for result in results]
-    results = [convert_lat_long_list(result) for result in results]
+    # Results are modified in place, in a single pass
+    for result in results:
+        convert_lat_long_dict(result)
+        convert_lat_long_list(result)
     return results
 
 
@@ -66,9 +69,22 @@ def convert_all_place_coordinates(response: JsonResponse) -> JsonResponse:
 
 def convert_all_timestamps(results: List[ResponseResult]) -> List[ResponseResult]:
     """Replace all date/time info with datetime objects, where possible"""
-    results = [convert_generic_timestamps(result) for result in results]
-    results = [convert_observation_timestamps(result) for result in results]
-    return results
+    return [
+        convert_observation_timestamps(convert_generic_timestamps(result)) for result in results
+    ]
+
+
+def convert_all_results(results: List[ResponseResult]) -> List[ResponseResult]:
+    """Convert both coordinates and date/time info in response items, in a single pass. This is
+    equivalent to :py:func:`.convert_all_coordinates` followed by :py:func:`.convert_all_timestamps`.
+    """
+    converted_results = []
+    for result in results:
+        convert_lat_long_dict(result)
+        convert_lat_long_list(result)
+        result = convert_generic_timestamps(result)
+        converted_results.append(convert_observation_timestamps(result))
+    return converted_results
 
 
 def convert_observation_histogram(response: JsonResponse) -> HistogramResponse:
@@ -173,7 +189,7 @@ def convert_observation_timestamps(result: ResponseResult) -> ResponseResult:
         observation['observed_on'] = try_datetime(observed_on)
 
     created_at = observation.get('created_at')
-    if not isinstance(created_at, datetime):
+    if 'created_at' in observation and not isinstance(created_at, datetime):
         observation['created_at'] = try_datetime(created_at)
 
     return observation
@@ -215,6 +231,8 @@ def ensure_list(
     value: Any, convert_csv: bool = False, delimiter: str = ','
 ) -> MutableSequence[Any]:
     """Convert an object, response, or (optionally) comma-separated string into a list"""
+    if isinstance(value, list):
+        return value
     # Handle the occacsional stray numpy array that got lost and made its way here
     try:
         value = value.tolist()
@@ -282,6 +300,13 @@ def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
     if not timestamp or not str(timestamp).strip():
         return None
 
+    # Most API timestamps are ISO 8601, which can be parsed much faster than other formats
+    if not kwargs and isinstance(timestamp, str) and _is_iso_date(timestamp):
+        try:
+            return isoparse(timestamp)
+        except ValueError:
+            pass
+
     try:
         # Suppress UnknownTimezoneWarning
         with catch_warnings():
@@ -292,6 +317,13 @@ def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
         return None
 
 
+def _is_iso_date(value: str) -> bool:
+    """Check if a string starts with a full ISO 8601 date (``YYYY-MM-DD``). Partial dates are
+    handled differently by ``isoparse()``, so those are left to ``parse()``.
+    """
+    return len(value) >= 10 and value[4] == '-' and value[7] == '-'
+
+
 def try_date(timestamp: Any, **kwargs) -> Optional[date]:
     """Parse a date string into a date, if valid; return ``None`` otherwise"""
     dt = try_datetime(timestamp, **kwargs)
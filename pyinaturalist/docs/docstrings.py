@@ -1,5 +1,6 @@
 """Utilities for copying and modifying docstrings with type annotations"""
 import re
+from functools import lru_cache
 from inspect import cleandoc
 from typing import Callable, Dict, Iterable, List, Optional, get_type_hints
 
@@ -67,26 +68,27 @@ class ApiDocstring:
     def _split_sections(docstring: str) -> Dict[str, str]:
         """Split a docstring into a dict of ``{section_title: section_content}``"""
         docstring = docstring or ''
-        sections = {k: '' for k in DEFAULT_SECTIONS}
+        section_lines: Dict[str, List[str]] = {k: [] for k in DEFAULT_SECTIONS}
         current_section = 'Description'
 
+        # Collect lines per section and join once at the end, instead of repeatedly concatenating
         for line in docstring.splitlines():
             if SECTION_PATTERN.match(line):
                 current_section = line.strip().rstrip(':')
-                sections[current_section] = ''
+                section_lines[current_section] = []
             else:
-                sections[current_section] += line + '\n'
+                section_lines[current_section].append(line)
 
         # Unindent section content and trim trailing whitespace
-        return {k: cleandoc(v.rstrip()) for k, v in sections.items()}
+        return {k: cleandoc('\n'.join(v).rstrip()) for k, v in section_lines.items()}
 
     def __str__(self) -> str:
         """Reassemble sections back into a complete docstring"""
-        docstring = self.sections['Description'] + '\n\n'
+        parts = [self.sections['Description'] + '\n\n']
         for section, content in self.sections.items():
             if content and section != 'Description':
-                docstring += f'{section}:\n{self._indent(content)}\n\n'
-        return docstring
+                parts.append(f'{section}:\n{self._indent(content)}\n\n')
+        return ''.join(parts)
 
 
 def copy_annotations(
@@ -96,7 +98,7 @@ def copy_annotations(
 ) -> Callable:
     """Copy type annotations from one or more template functions to a target function"""
     for template_function in template_functions:
-        annotations = get_type_hints(template_function)
+        annotations = dict(_get_type_hints(template_function))
         if not include_return:
             annotations.pop('return', None)
         if hasattr(target_function, '__annotations__'):
@@ -106,6 +108,14 @@ def copy_annotations(
     return target_function
 
 
+@lru_cache(maxsize=None)
+def _get_type_hints(func: TemplateFunction) -> Dict:
+    """Get type hints from a template function. These are only evaluated once per template function.
+    The returned dict should not be modified.
+    """
+    return get_type_hints(func)
+
+
 def copy_docstrings(
     target_function: Callable,
     template_functions: List[TemplateFunction],
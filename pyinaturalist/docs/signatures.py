@@ -1,6 +1,6 @@
 """Utilities for modifying function signatures using ``python-forge``"""
-from functools import partial
-from inspect import Parameter, ismethod, signature
+from functools import lru_cache, partial, wraps
+from inspect import Parameter, iscoroutinefunction, ismethod, signature
 from logging import getLogger
 from typing import Callable, Dict, Iterable, List, Optional, Type
 
@@ -145,12 +145,7 @@ def copy_signatures(
 
     # Add and combine parameters from all template functions, excluding duplicates, self, and *args
     for func in template_functions:
-        new_fparams = {
-            k: v
-            for k, v in forge.copy(func).signature.parameters.items()
-            if k != 'self' and v.kind != Parameter.VAR_POSITIONAL
-        }
-        fparams.update(new_fparams)
+        fparams.update(_get_template_params(func))
 
     # Manually remove any excluded parameters
     for key in ensure_list(exclude_args):
@@ -158,7 +153,76 @@ def copy_signatures(
 
     fparams = deduplicate_var_kwargs(fparams)
     revision = forge.sign(*fparams.values())
-    return revision(target_function)
+    return freeze_signature(revision(target_function))
+
+
+def freeze_signature(revised_function: Callable) -> Callable:
+    """Replace the wrapper created by ``forge.sign()`` with one that maps arguments using values
+    computed once at decoration time.
+
+    forge rebuilds its parameter mapping on every call, which takes longer than most cached API
+    requests for functions with many params (like :py:func:`.get_observations`). Template params
+    don't use any of forge's converters or validators, so mapping them only requires applying
+    defaults and passing everything else through as keyword args. Anything more complicated than
+    that is left to forge.
+    """
+    mapper = revised_function.__mapper__  # type: ignore
+    func = revised_function.__wrapped__  # type: ignore
+    public_params = mapper.public_signature.parameters.values()
+    private_params = mapper.private_signature.parameters
+
+    # Params should map either to a param with the same name or to the target's **kwargs
+    def _is_simple_mapping(from_name, to_name):
+        return from_name == to_name or private_params[to_name].kind == Parameter.VAR_KEYWORD
+
+    if (
+        iscoroutinefunction(func)
+        or not all(_is_simple_mapping(k, v) for k, v in mapper.parameter_map.items())
+        or any(
+            p.converter or p.validator or p.bound or p.name != p.interface_name
+            for p in mapper.fsignature
+        )
+        or any(
+            p.kind in (Parameter.POSITIONAL_ONLY, Parameter.VAR_POSITIONAL)
+            for p in private_params.values()
+        )
+        or not any(p.kind == Parameter.VAR_KEYWORD for p in private_params.values())
+    ):
+        return revised_function
+
+    positional = [p.name for p in public_params if p.kind == Parameter.POSITIONAL_OR_KEYWORD]
+    required = {p.name for p in public_params if p.default is Parameter.empty}
+    required.discard(next(p.name for p in public_params if p.kind == Parameter.VAR_KEYWORD))
+    defaults = {p.name: p.default for p in public_params if p.default is not Parameter.empty}
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        arguments = dict(zip(positional, args))
+        # For invalid arguments, let forge raise the same errors it normally would
+        if (
+            len(args) > len(positional)
+            or not arguments.keys().isdisjoint(kwargs)
+            or not required <= arguments.keys() | kwargs.keys()
+        ):
+            mapper(*args, **kwargs)
+        return func(**{**defaults, **arguments, **kwargs})
+
+    wrapper.__mapper__ = mapper  # type: ignore
+    wrapper.__signature__ = mapper.public_signature  # type: ignore
+    return wrapper
+
+
+@lru_cache(maxsize=None)
+def _get_template_params(func: TemplateFunction) -> Dict:
+    """Get params from a template function, excluding self and *args. Most templates are applied to
+    several functions, so these are only copied once per template function. The returned dict should
+    not be modified.
+    """
+    return {
+        k: v
+        for k, v in forge.copy(func).signature.parameters.items()
+        if k != 'self' and v.kind != Parameter.VAR_POSITIONAL
+    }
 
 
 def deduplicate_var_kwargs(params: Dict) -> Dict:
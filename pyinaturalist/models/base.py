@@ -2,10 +2,11 @@
 from collections import UserList
 from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
 from logging import getLogger
 from os.path import expanduser
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, Type, TypeVar
+from typing import Dict, FrozenSet, Generic, List, Optional, Type, TypeVar
 
 from attr import Factory, asdict, define, field, fields_dict
 
@@ -58,12 +59,8 @@ class BaseModel:
         if isinstance(value, cls):
             return value
 
-        cls_attrs = {k.lstrip('_'): v for k, v in fields_dict(cls).items()}
-
-        def is_valid_attr(k):
-            return (k in cls_attrs and cls_attrs[k].init is True) or k in cls.temp_attrs
-
-        valid_json = {k: v for k, v in value.items() if is_valid_attr(k) and v is not None}
+        valid_attrs = _get_valid_attrs(cls)  # type: ignore[arg-type]
+        valid_json = {k: v for k, v in value.items() if k in valid_attrs and v is not None}
         return cls(**valid_json, **kwargs)
 
     @classmethod
@@ -239,6 +236,15 @@ class BaseModelCollection(BaseModel, UserList, Generic[T]):
         return '\n'.join([str(obj) for obj in self.data])
 
 
+@lru_cache(maxsize=None)
+def _get_valid_attrs(cls: Type[BaseModel]) -> FrozenSet[str]:
+    """Get names of all attributes that a model can be initialized with from JSON. This is the same
+    for every instance of a model class, so it's only computed once per class.
+    """
+    init_attrs = {k.lstrip('_') for k, v in fields_dict(cls).items() if v.init is True}
+    return frozenset(init_attrs | set(cls.temp_attrs))
+
+
 def load_json(value: ResponseOrFile) -> ResponseOrResults:
     """Load a JSON string, file path, or file-like object"""
     if not value:
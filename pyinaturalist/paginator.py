@@ -1,4 +1,4 @@
-from asyncio import AbstractEventLoop, get_running_loop
+from asyncio import AbstractEventLoop, gather, get_running_loop
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
@@ -20,14 +20,18 @@ from requests import Response
 
 from pyinaturalist.constants import (
     EXPORT_URL,
+    IDS_PER_REQUEST,
     LARGE_REQUEST_WARNING,
+    MAX_CONCURRENT_REQUESTS,
     PER_PAGE_RESULTS,
     REQUESTS_PER_MINUTE,
     IntOrStr,
     JsonResponse,
+    MultiIntOrStr,
     RequestParams,
     ResponseResult,
 )
+from pyinaturalist.converters import ensure_list
 from pyinaturalist.models import T
 
 logger = getLogger(__name__)
@@ -82,20 +86,43 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
     async def __aiter__(self) -> AsyncIterator[T]:
         """Iterate over paginated results, with non-blocking requests sent from a separate thread"""
         loop = self.loop or get_running_loop()
-        with ThreadPoolExecutor(max_workers=1) as executor:
+        with self._executor() as executor:
             while not self.exhausted:
                 for result in await loop.run_in_executor(executor, self.next_page):
                     yield result
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over paginated results"""
-        while not self.exhausted:
-            for result in self.next_page():
-                yield result
+        yield from self._iter_pages(self.next_page)
 
     async def async_all(self) -> List[T]:  # Better name TBD?
-        """Get all results in a single list (non-blocking)"""
-        return [result async for result in self]
+        """Get all results in a single list (non-blocking).
+
+        If the total number of pages is known after the first request, all remaining pages will be
+        requested concurrently (up to ``MAX_CONCURRENT_REQUESTS`` at a time). Rate-limiting still
+        applies to these requests.
+        """
+        loop = self.loop or get_running_loop()
+        with self._executor(MAX_CONCURRENT_REQUESTS) as executor:
+            results = await loop.run_in_executor(executor, self.next_page)
+            remaining_pages = self._get_remaining_pages()
+
+            # Pages can't be determined in advance; fetch them sequentially
+            if remaining_pages is None:
+                while not self.exhausted:
+                    results.extend(await loop.run_in_executor(executor, self.next_page))
+                return results
+
+            pages = await gather(
+                *[loop.run_in_executor(executor, self._get_page, page) for page in remaining_pages]
+            )
+
+        for page_results in pages:
+            self.results_fetched += len(page_results)
+            results.extend(self.model.from_json_list(page_results))
+        self.page += len(remaining_pages)
+        self.exhausted = True
+        return results[: self.total_limit] if self.total_limit else results
 
     def all(self) -> List[T]:
         """Get all results in a single list"""
@@ -139,14 +166,7 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         if self.total_limit and self.results_fetched + self.per_page > self.total_limit:
             self.per_page = self.total_limit - self.results_fetched
 
-        # Fetch results; handle response object or dict
-        response = self.request_function(
-            *self.request_args,
-            **self.request_kwargs,
-            **self._get_pagination_kwargs(),
-        )
-        if isinstance(response, Response):
-            response = response.json()
+        response = self._request(**self._get_pagination_kwargs())
         results = response.get('results', response)
 
         # Note: For id-based pagination, only the first page's 'total_results' is accurate
@@ -162,11 +182,72 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
         return results
 
-    # The following two methods may be overridden by subclasses for different pagination methods
+    def _get_page(self, page: int) -> List[ResponseResult]:
+        """Get a specific page of results, as raw JSON, without updating pagination state"""
+        kwargs = {**self._get_pagination_kwargs(), 'page': page}
+
+        # If a limit is specified, avoid fetching more results than needed on the last page
+        if self.total_limit:
+            kwargs['per_page'] = min(self.per_page, self.total_limit - (page - 1) * self.per_page)
+        response = self._request(**kwargs)
+        return response.get('results', response)
+
+    def _request(self, **pagination_kwargs) -> JsonResponse:
+        """Send a request with the given pagination parameters; handle response object or dict"""
+        response = self.request_function(
+            *self.request_args,
+            **self.request_kwargs,
+            **pagination_kwargs,
+        )
+        if isinstance(response, Response):
+            response = response.json()
+        return response
+
+    def _iter_pages(self, get_next_page: Callable[[], List]) -> Iterator:
+        """Iterate over results from each page. If there are multiple pages, each next page is
+        requested from a separate thread while results from the current page are being processed.
+        """
+        if self.exhausted:
+            return
+        results = get_next_page()
+        if self.exhausted:
+            yield from results
+            return
+
+        # Don't wait for a pending request on exit, in case iteration is stopped early
+        executor = self._executor()
+        try:
+            while True:
+                next_page = None if self.exhausted else executor.submit(get_next_page)
+                yield from results
+                if next_page is None:
+                    return
+                results = next_page.result()
+        finally:
+            executor.shutdown(wait=False)
+
+    def _executor(self, max_workers: int = 1) -> ThreadPoolExecutor:
+        """Get a thread pool to send requests from, with a session shared between worker threads"""
+        from pyinaturalist.session import get_thread_pool
+
+        return get_thread_pool(max_workers, session=self.request_kwargs.get('session'))
+
+    # The following methods may be overridden by subclasses for different pagination methods
     def _get_pagination_kwargs(self) -> RequestParams:
         """Get any extra request parameters needed for pagination"""
         return {'page': self.page, 'per_page': self.per_page}
 
+    def _get_remaining_pages(self) -> Optional[List[int]]:
+        """Get the page numbers of all remaining pages, if they can be determined in advance;
+        otherwise, return ``None``
+        """
+        if self.exhausted:
+            return []
+        total_results = self.total_results or 0
+        if self.total_limit:
+            total_results = min(total_results, self.total_limit)
+        return list(range(self.page, ceil(total_results / self.per_page) + 1))
+
     def _check_exhausted(self, page_results: Optional[List] = None) -> bool:
         """Check all conditions that indicate no more results are available.
         (relevant conditions and error cases vary by API endpoint)
@@ -237,6 +318,10 @@ class IDRangePaginator(Paginator):
             'order': 'asc',
         }
 
+    def _get_remaining_pages(self):
+        """Each page depends on the last ID of the previous page, so can't be determined in advance"""
+        return None if not self.exhausted else []
+
     def _next_page(self) -> List[ResponseResult]:
         # Update params for next request, if there are more results
         results = super()._next_page()
@@ -266,15 +351,24 @@ class IDPaginator(Paginator):
             self.exhausted = True
             return []
 
-        response = self.request_function(next_ids, *self.request_args, **self.request_kwargs)
-        if isinstance(response, Response):
-            response = response.json()
-
-        results = response['results'] if 'results' in response else [response]
+        results = self._get_page(next_ids)
         self.page += 1
         self.results_fetched += len(results)
         return results
 
+    def _get_page(self, ids):
+        """Get results for a single batch of IDs"""
+        response = self.request_function(ids, *self.request_args, **self.request_kwargs)
+        if isinstance(response, Response):
+            response = response.json()
+        return response['results'] if 'results' in response else [response]
+
+    def _get_remaining_pages(self):
+        """All remaining batches of IDs are known in advance"""
+        remaining_batches = list(self.id_batches)
+        self.id_batches.clear()
+        return remaining_batches
+
 
 def _chunkify(iterable: Iterable, max_size: int) -> Iterator[List]:
     """Split an iterable into chunks of a max size"""
@@ -319,6 +413,10 @@ class AutocompletePaginator(Paginator):
             kwargs['order_by'] = 'area'
         return kwargs
 
+    def _get_remaining_pages(self):
+        """Later requests use different sort order than the first, so these are fetched sequentially"""
+        return None
+
 
 if TYPE_CHECKING:
     MixinBase = Paginator
@@ -339,9 +437,7 @@ class JsonPaginatorMixin(MixinBase):
 
     def __iter__(self) -> Iterator[ResponseResult]:
         """Iterate over paginated results, and skip conversion to model objects"""
-        while not self.exhausted:
-            for result in self._next_page():
-                yield result
+        yield from self._iter_pages(self._next_page)
 
     def all(self) -> JsonResponse:  # type: ignore
         results = super().all()
@@ -365,6 +461,10 @@ class JsonIDRangePaginator(JsonPaginatorMixin, IDRangePaginator):
     pass
 
 
+class JsonIDPaginator(JsonPaginatorMixin, IDPaginator):
+    pass
+
+
 def paginate_all(request_function: Callable, *args, method: str = 'page', **kwargs) -> JsonResponse:
     """Get all pages of a multi-page request. Explicit pagination parameters will be overridden.
 
@@ -375,6 +475,46 @@ def paginate_all(request_function: Callable, *args, method: str = 'page', **kwar
     return paginator(request_function, *args, **kwargs).all()
 
 
+def paginate_iter(
+    request_function: Callable, *args, method: str = 'page', **kwargs
+) -> Iterator[ResponseResult]:
+    """Iterate over all results of a multi-page request, one page at a time. Unlike
+    :py:func:`.paginate_all`, this doesn't keep previous pages in memory, and results can be
+    processed before all pages have been fetched. Explicit pagination parameters will be overridden.
+
+    Example:
+        >>> for obs in paginate_iter(get_observations, method='id', user_id='my_username'):
+        ...     print(obs['id'])
+
+    Returns:
+        Individual results, in the same format as ``request_function``
+    """
+    paginator = JsonIDRangePaginator if method == 'id' else JsonPaginator
+    return iter(paginator(request_function, *args, **kwargs))
+
+
+def paginate_ids(
+    request_function: Callable,
+    ids: MultiIntOrStr,
+    *args,
+    ids_per_request: int = IDS_PER_REQUEST,
+    **kwargs,
+) -> JsonResponse:
+    """Get results for any number of IDs, for endpoints that only accept a limited number of IDs per
+    request. IDs will be split into batches, and ``request_function`` will be called once per batch.
+
+    Returns:
+        Response dict containing combined results, in the same format as ``api_func``
+    """
+    return JsonIDPaginator(
+        request_function,
+        *args,
+        ids=ensure_list(ids, convert_csv=True),
+        ids_per_request=ids_per_request,
+        **kwargs,
+    ).all()
+
+
 class WrapperPaginator(Paginator):
     """Paginator class that wraps results that have already been fetched."""
 
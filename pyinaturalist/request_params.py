@@ -135,7 +135,7 @@ def convert_observation_params(params):
 
     # Split out photos and sounds to upload separately
     photos = ensure_list(params.pop('local_photos', None))
-    photos.extend(ensure_list(params.pop('photos', None)))  # Alias for 'local_photos'
+    photos = photos + ensure_list(params.pop('photos', None))  # Alias for 'local_photos'
     sounds = ensure_list(params.pop('sounds', None))
     photo_ids = ensure_list(params.pop('photo_ids', None))
 
@@ -256,8 +256,10 @@ def validate_multiple_choice_params(params: RequestParams) -> RequestParams:
     """
     # Collect info on any validation errors
     errors = []
-    for key, choices in MULTIPLE_CHOICE_PARAMS.items():
-        params, error_msg = _validate_multiple_choice_param(params, key, choices)
+    for key in [k for k in params if k in MULTIPLE_CHOICE_PARAMS]:
+        params, error_msg = _validate_multiple_choice_param(
+            params, key, MULTIPLE_CHOICE_PARAMS[key]
+        )
         if error_msg:
             errors.append(error_msg)
 
@@ -301,7 +303,7 @@ def _validate_multiple_choice_param(
             return True
         if not isinstance(value, list):
             value = [value]
-        return all([v in choices for v in value])
+        return all(v in choices for v in value)
 
     def normalize(value):
         if not value:
@@ -310,9 +312,11 @@ def _validate_multiple_choice_param(
             return [v.replace(' ', '_') for v in value]
         return value.replace(' ', '_')
 
+    if key not in params:
+        return params, None
+
     error_msg = None
-    if key in params:
-        params[key] = normalize(params[key])
-    if not is_valid(params.get(key), choices):
+    params[key] = normalize(params[key])
+    if not is_valid(params[key], choices):
         error_msg = MULTIPLE_CHOICE_ERROR_MSG.format(key, choices, params[key])
     return params, error_msg
@@ -1,9 +1,9 @@
 """Session class and related functions for preparing and sending API requests"""
 import threading
-from json import JSONDecodeError
-from logging import getLogger
+from concurrent.futures import ThreadPoolExecutor
+from logging import DEBUG, INFO, getLogger
 from os import getenv
-from typing import Dict, Optional, Type
+from typing import Callable, Dict, Optional, Type
 from unittest.mock import Mock
 
 from requests import PreparedRequest, Request, Response, Session
@@ -18,6 +18,7 @@ from requests_ratelimiter import (
     RequestRate,
     SQLiteBucket,
 )
+from urllib3.connectionpool import port_by_scheme
 from urllib3.util import Retry
 
 import pyinaturalist
@@ -26,6 +27,8 @@ from pyinaturalist.constants import (
     CACHE_FILE,
     CONNECT_TIMEOUT,
     MAX_DELAY,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     RATELIMIT_FILE,
     REQUEST_BURST_RATE,
     REQUEST_RETRIES,
@@ -48,6 +51,12 @@ from pyinaturalist.request_params import (
     preprocess_request_params,
 )
 
+# Optionally use ultrajson instead of stdlib json, if available
+try:
+    import ujson as json
+except ImportError:
+    import json  # type: ignore
+
 # Mock response content to return in dry-run mode
 MOCK_RESPONSE = Mock(spec=Response)
 MOCK_RESPONSE.json.return_value = {'results': [], 'total_results': 0, 'access_token': ''}
@@ -63,6 +72,37 @@ logger = getLogger('pyinaturalist')
 thread_local = threading.local()
 
 
+class ClientRetry(Retry):
+    """Retry settings that also report rate-limited (``429``) responses, since these are retried by
+    ``urllib3`` before the session's rate limiter would otherwise see them. Any ``Retry-After``
+    delay sent by the server is capped at ``MAX_DELAY`` seconds.
+
+    Args:
+        on_rate_limit: Callback that takes the URL of a rate-limited request
+    """
+
+    def __init__(self, *args, on_rate_limit: Optional[Callable[[str], None]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_rate_limit = on_rate_limit
+
+    def new(self, **kwargs) -> 'ClientRetry':
+        retries = super().new(**kwargs)
+        retries.on_rate_limit = self.on_rate_limit
+        return retries
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_DELAY)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, **kwargs):
+        if self.on_rate_limit and _pool and response is not None and response.status == 429:
+            host = _pool.host
+            if _pool.port and _pool.port != port_by_scheme.get(_pool.scheme):
+                host = f'{host}:{_pool.port}'
+            self.on_rate_limit(f'{_pool.scheme}://{host}{url}')
+        return super().increment(method, url, response, error, _pool, **kwargs)
+
+
 class ClientSession(CacheMixin, LimiterMixin, Session):
     """Custom session class used for sending API requests. Combines the following features and
     settings:
@@ -71,6 +111,7 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
     * Rate-limiting (skipped for cached requests)
     * Retries
     * Timeouts
+    * Connection pooling
     """
 
     def __init__(
@@ -112,10 +153,11 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             kwargs: Additional keyword arguments for :py:class:`~requests_cache.session.CachedSession`
                 and/or :py:class:`~requests_ratelimiter.requests_ratelimiter.LimiterSession`
         """
-        # Extend default URL expiration patterns with user-provided ones, if any
-        url_patterns = CACHE_EXPIRATION
-        if urls_expire_after:
-            url_patterns.update(urls_expire_after)
+        # Extend default URL expiration patterns with user-provided ones, if any. Patterns are
+        # matched in order, so user-provided patterns go first to take precedence over defaults.
+        url_patterns: Dict = dict(urls_expire_after or {})
+        for pattern, expiration in CACHE_EXPIRATION.items():
+            url_patterns.setdefault(pattern, expiration)
         self.timeout = timeout
 
         super().__init__(  # type: ignore  # false positive
@@ -139,11 +181,19 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             **kwargs,
         )
 
-        # Retry settings
-        self.retries = Retry(
-            total=max_retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES
+        # Retry and connection pool settings. If a request is rate-limited, the limiter is also
+        # updated to delay other requests that share this session (including from other threads).
+        self.retries = ClientRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            on_rate_limit=self._on_rate_limit,
+        )
+        adapter = HTTPAdapter(
+            max_retries=self.retries,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
         )
-        adapter = HTTPAdapter(max_retries=self.retries)
         self.mount('https://', adapter)
 
         # Default headers
@@ -247,7 +297,9 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             json=json,
             params=params,
         )
-        logger.info(format_request(request, dry_run))
+        # Formatting request/response details is relatively slow, so skip it if it won't be logged
+        if logger.isEnabledFor(INFO):
+            logger.info(format_request(request, dry_run))
 
         # Make a mock request, if specified
         if dry_run or is_dry_run_enabled(method):
@@ -264,7 +316,8 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             stream=stream,
             verify=verify,
         )
-        logger.debug(format_response(response))
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(format_response(response))
 
         # Raise an exception if the request failed (after retries are exceeded)
         if raise_for_status:
@@ -309,6 +362,13 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         )
         return response
 
+    def _on_rate_limit(self, url: str):
+        """Fill the limiter bucket for a request that was rate-limited by the server"""
+        request = Request('GET', url).prepare()
+        # The bucket will only be missing if the request was sent without the limiter
+        if self._bucket_name(request) in self.limiter.bucket_group:
+            self._fill_bucket(request)
+
     def _validate_json(
         self,
         request: PreparedRequest,
@@ -326,9 +386,9 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
 
         # Attempt to decode the response content as JSON
         try:
-            response_json = response.json()
+            response_json = json.loads(response.content)
         # Update retry state and wait before sending the request again
-        except JSONDecodeError as e:
+        except ValueError as e:
             logger.info('Invalid JSON response; retrying...')
             retries = retries or self.retries
             retries = retries.increment(
@@ -385,9 +445,14 @@ def env_to_bool(environment_variable: str) -> bool:
 
 def get_local_session(**kwargs) -> ClientSession:
     """Get a thread-local Session object with default settings. This will be reused across requests
-    to take advantage of connection pooling and (optionally) caching. If used in a multi-threaded
-    context (for example, a :py:class:`~concurrent.futures.ThreadPoolExecutor`), this will create
-    and store a separate session object for each thread.
+    to take advantage of connection pooling and (optionally) caching.
+
+    If used in a multi-threaded context (for example, your own
+    :py:class:`~concurrent.futures.ThreadPoolExecutor`), this will create and store a separate
+    session object for each thread. Worker threads started by pyinaturalist itself (see
+    :py:func:`.get_thread_pool`) instead share the session of the thread that started them, which
+    relies on :py:class:`.ClientSession` (including its cache and rate limiter) being safe to share
+    across threads.
 
     Args:
         kwargs: Keyword arguments for :py:func:`.ClientSession`
@@ -397,6 +462,33 @@ def get_local_session(**kwargs) -> ClientSession:
     return thread_local.session
 
 
+def set_local_session(session: ClientSession):
+    """Set the Session object to use for the current thread. This can be used to share a single
+    session (and its connection pool) across multiple threads.
+
+    Args:
+        session: Session object to use for the current thread
+    """
+    thread_local.session = session
+
+
+def get_thread_pool(
+    max_workers: int = 1, session: Optional[ClientSession] = None
+) -> ThreadPoolExecutor:
+    """Get a thread pool to send requests from. Worker threads will use either the given session or
+    the current thread's session (and its open connections), instead of each creating a new session.
+
+    Args:
+        max_workers: Maximum number of worker threads
+        session: Session object to use in worker threads
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=set_local_session,
+        initargs=(session or get_local_session(),),
+    )
+
+
 def get_refresh_params(endpoint) -> Dict:
     """In some cases, we need to be sure we have the most recent version of a resource, for example
     when updating projects. Normally we would handle this with cache headers, but the CDN cache does
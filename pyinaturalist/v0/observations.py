@@ -8,7 +8,7 @@ from pyinaturalist.constants import (
     ListResponse,
     MultiFile,
 )
-from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps, ensure_list
+from pyinaturalist.converters import convert_all_results, ensure_list
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.exceptions import ObservationNotFound
@@ -81,8 +81,7 @@ def get_observations(**params) -> Union[List, str]:
     response = get(f'{API_V0}/observations.{response_format}', **params)
     if response_format == 'json':
         observations = response.json()
-        observations = convert_all_coordinates(observations)
-        observations = convert_all_timestamps(observations)
+        observations = convert_all_results(observations)
         return observations
     else:
         return response.text
@@ -1,10 +1,11 @@
 # TODO: pprint examples are out of date
-from copy import deepcopy
 from logging import getLogger
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pyinaturalist.constants import (
     API_V1,
+    IDS_PER_REQUEST,
+    MAX_CONCURRENT_REQUESTS,
     V1_OBS_ORDER_BY_PROPERTIES,
     HistogramResponse,
     IntOrStr,
@@ -16,20 +17,18 @@ from pyinaturalist.constants import (
     ResponseResult,
 )
 from pyinaturalist.converters import (
-    convert_all_coordinates,
-    convert_all_timestamps,
+    convert_all_results,
     convert_generic_timestamps,
     convert_histogram,
     convert_observation_histogram,
-    convert_observation_timestamps,
     ensure_list,
 )
 from pyinaturalist.docs import document_common_args, document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.exceptions import ObservationNotFound
-from pyinaturalist.paginator import paginate_all
+from pyinaturalist.paginator import paginate_all, paginate_ids
 from pyinaturalist.request_params import convert_observation_params, validate_multiple_choice_param
-from pyinaturalist.session import delete, get, post, put
+from pyinaturalist.session import delete, get, get_thread_pool, post, put
 
 logger = getLogger(__name__)
 
@@ -44,6 +43,7 @@ def get_observations(**params) -> JsonResponse:
 
     * :fas:`lock-open` :ref:`Optional authentication <auth>` (For private/obscured coordinates)
     * API reference: :v1:`GET /observations <Observations/get_observations>`
+    * If you only need observation IDs, use ``only_id=True`` for a much smaller response
 
     Examples:
 
@@ -80,8 +80,7 @@ def get_observations(**params) -> JsonResponse:
     else:
         observations = get(f'{API_V1}/observations', **params).json()
 
-    observations['results'] = convert_all_coordinates(observations['results'])
-    observations['results'] = convert_all_timestamps(observations['results'])
+    observations['results'] = convert_all_results(observations['results'])
     return observations
 
 
@@ -98,6 +97,7 @@ def get_observations_by_id(
     * This endpoint returns more complete annotation details compared to
       :py:func:`~pyinaturalist.v1.observations.get_observations`.
       See :py:class:`.Annotation` for details.
+    * Large numbers of IDs will be split into multiple requests
 
     Example:
         >>> response = get_observations_by_id(16227955)
@@ -115,11 +115,15 @@ def get_observations_by_id(
     Returns:
         Response dict containing observation records
     """
+    if len(ensure_list(observation_id, convert_csv=True)) > IDS_PER_REQUEST:
+        return paginate_ids(
+            get_observations_by_id, observation_id, access_token=access_token, **params
+        )
+
     observations = get(
         f'{API_V1}/observations', ids=observation_id, access_token=access_token, **params
     ).json()
-    observations['results'] = convert_all_coordinates(observations['results'])
-    observations['results'] = convert_all_timestamps(observations['results'])
+    observations['results'] = convert_all_results(observations['results'])
     return observations
 
 
@@ -348,8 +352,8 @@ def get_observation_taxon_summary(observation_id: int, **params) -> JsonResponse
         Response dict containing taxon summary, optionally with conservation status and listed taxon
     """
     results = get(f'{API_V1}/observations/{observation_id}/taxon_summary', **params).json()
-    results['conservation_status'] == convert_generic_timestamps(results['conservation_status'])
-    results['listed_taxon'] == convert_generic_timestamps(results['listed_taxon'])
+    results['conservation_status'] = convert_generic_timestamps(results['conservation_status'])
+    results['listed_taxon'] = convert_generic_timestamps(results['listed_taxon'])
     return results
 
 
@@ -462,6 +466,8 @@ def upload(
 
     * :fa:`lock` :ref:`Requires authentication <auth>`
     * API reference: :v1:`POST /observation_photos <Observation_Photos/post_observation_photos>`
+    * Photos are uploaded in order, and the first photo will be the observation's default photo
+    * Multiple sounds will be uploaded concurrently
 
     Example:
 
@@ -491,23 +497,23 @@ def upload(
         Information about the uploaded file(s)
     """
     params['raise_for_status'] = False
-    responses = []
     photos, sounds = ensure_list(photos), ensure_list(sounds)
     logger.info(f'Uploading {len(photos)} photos and {len(sounds)} sounds')
 
-    # Upload photos
-    photo_params = deepcopy(params)
-    photo_params['observation_photo[observation_id]'] = observation_id
-    for photo in photos:
-        response = post(f'{API_V1}/observation_photos', files=photo, **photo_params)
-        responses.append(response)
-
-    # Upload sounds
-    sound_params = deepcopy(params)
-    sound_params['observation_sound[observation_id]'] = observation_id
-    for sound in sounds:
-        response = post(f'{API_V1}/observation_sounds', files=sound, **sound_params)
-        responses.append(response)
+    photo_url, sound_url = f'{API_V1}/observation_photos', f'{API_V1}/observation_sounds'
+    photo_params: Dict[str, Any] = {**params, 'observation_photo[observation_id]': observation_id}
+    sound_params: Dict[str, Any] = {**params, 'observation_sound[observation_id]': observation_id}
+
+    # Photos are uploaded one at a time, since their order determines the observation's default
+    # photo. Any sounds are uploaded concurrently in the background in the meantime.
+    if sounds and len(photos) + len(sounds) > 1:
+        with get_thread_pool(MAX_CONCURRENT_REQUESTS, session=params.get('session')) as executor:
+            futures = [executor.submit(post, sound_url, files=f, **sound_params) for f in sounds]
+            responses = [post(photo_url, files=f, **photo_params) for f in photos]
+        responses += [future.result() for future in futures]
+    else:
+        responses = [post(photo_url, files=f, **photo_params) for f in photos]
+        responses += [post(sound_url, files=f, **sound_params) for f in sounds]
 
     # Attach previously uploaded photos by ID
     if photo_ids:
@@ -579,8 +585,7 @@ def get_observation(
     Raises:
         :py:exc:`.ObservationNotFound` If an invalid observation is specified
     """
-
-    response = get_observations(id=observation_id, access_token=access_token, **params)
+    response = get_observations_by_id(observation_id, access_token=access_token, **params)
     if response['results']:
-        return convert_observation_timestamps(response['results'][0])
+        return response['results'][0]
     raise ObservationNotFound()
@@ -1,11 +1,15 @@
 from functools import wraps
 from typing import Optional
 
-from pyinaturalist.constants import API_V1, JsonResponse, MultiInt
-from pyinaturalist.converters import convert_all_coordinates, convert_all_place_coordinates
+from pyinaturalist.constants import API_V1, IDS_PER_REQUEST, JsonResponse, MultiInt
+from pyinaturalist.converters import (
+    convert_all_coordinates,
+    convert_all_place_coordinates,
+    ensure_list,
+)
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
-from pyinaturalist.paginator import AutocompletePaginator, JsonPaginator
+from pyinaturalist.paginator import AutocompletePaginator, JsonPaginator, paginate_ids
 from pyinaturalist.session import get
 
 
@@ -15,6 +19,7 @@ def get_places_by_id(place_id: MultiInt, **params) -> JsonResponse:
     .. rubric:: Notes
 
     * API reference: :v1:`GET /places/{id} <Places/get_places_id>`
+    * Large numbers of IDs will be split into multiple requests
 
     Example:
         >>> response = get_places_by_id([67591, 89191])
@@ -33,12 +38,11 @@ def get_places_by_id(place_id: MultiInt, **params) -> JsonResponse:
     Returns:
         Response dict containing place records
     """
-    response = get(f'{API_V1}/places', ids=place_id, **params)
+    if len(ensure_list(place_id, convert_csv=True)) > IDS_PER_REQUEST:
+        return paginate_ids(get_places_by_id, place_id, **params)
 
-    # Convert coordinates to floats
-    places = response.json()
-    places['results'] = convert_all_coordinates(places['results'])
-    return places
+    response = get(f'{API_V1}/places', ids=place_id, **params)
+    return _convert_places(response.json())
 
 
 @document_request_params(docs._bounding_box, docs._name)
@@ -115,9 +119,13 @@ def get_places_autocomplete(q: Optional[str] = None, **params) -> JsonResponse:
         places = PlaceAutocompletePaginator(q=q, **params).all()
     else:
         places = get(f'{API_V1}/places/autocomplete', q=q, **params).json()
+    return _convert_places(places)
+
 
-    places['results'] = convert_all_coordinates(places['results'])
-    return places
+def _convert_places(response: JsonResponse) -> JsonResponse:
+    """Convert coordinates to floats for all places in a response. Results are modified in place."""
+    convert_all_coordinates(response['results'])
+    return response
 
 
 class PlaceAutocompletePaginator(JsonPaginator, AutocompletePaginator):  # type: ignore
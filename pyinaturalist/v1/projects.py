@@ -9,7 +9,7 @@ from pyinaturalist.constants import (
     MultiInt,
     MultiIntOrStr,
 )
-from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps, ensure_list
+from pyinaturalist.converters import convert_all_results, ensure_list
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.paginator import paginate_all
@@ -60,8 +60,7 @@ def get_projects(**params) -> JsonResponse:
     else:
         projects = get(f'{API_V1}/projects', **params).json()
 
-    projects['results'] = convert_all_coordinates(projects['results'])
-    projects['results'] = convert_all_timestamps(projects['results'])
+    projects['results'] = convert_all_results(projects['results'])
     return projects
 
 
@@ -109,8 +108,7 @@ def get_projects_by_id(
     )
 
     projects = response.json()
-    projects['results'] = convert_all_coordinates(projects['results'])
-    projects['results'] = convert_all_timestamps(projects['results'])
+    projects['results'] = convert_all_results(projects['results'])
     return projects
 
 
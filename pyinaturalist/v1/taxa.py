@@ -1,8 +1,8 @@
-from pyinaturalist.constants import API_V1, JsonResponse, MultiInt
-from pyinaturalist.converters import convert_all_timestamps
+from pyinaturalist.constants import API_V1, IDS_PER_REQUEST, JsonResponse, MultiInt
+from pyinaturalist.converters import convert_all_timestamps, ensure_list
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
-from pyinaturalist.paginator import paginate_all
+from pyinaturalist.paginator import paginate_all, paginate_ids
 from pyinaturalist.request_params import convert_rank_range
 from pyinaturalist.session import get
 
@@ -48,6 +48,7 @@ def get_taxa_by_id(taxon_id: MultiInt, **params) -> JsonResponse:
     .. rubric:: Notes
 
     * API reference: :v1:`GET /taxa/{id} <Taxa/get_taxa_id>`
+    * Large numbers of IDs will be split into multiple requests
 
     Example:
         >>> response = get_taxa_by_id(343248)
@@ -71,6 +72,9 @@ def get_taxa_by_id(taxon_id: MultiInt, **params) -> JsonResponse:
     Returns:
         Response dict containing taxon records
     """
+    if len(ensure_list(taxon_id, convert_csv=True)) > IDS_PER_REQUEST:
+        return paginate_ids(get_taxa_by_id, taxon_id, **params)
+
     response = get(f'{API_V1}/taxa', ids=taxon_id, **params)
     taxa = response.json()
     taxa['results'] = convert_all_timestamps(taxa['results'])
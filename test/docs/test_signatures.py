@@ -1,4 +1,8 @@
-# from pyinaturalist.docs import copy_signatures, document_request_params
+from inspect import signature
+
+import pytest
+
+from pyinaturalist.docs import copy_signatures
 
 
 def test_document_request_params():
@@ -7,3 +11,39 @@ def test_document_request_params():
 
 def test_copy_signatures():
     pass
+
+
+def test_copy_signatures__reused_template():
+    def template(arg_1: str = None, arg_2: bool = False):
+        pass
+
+    def func_1(**kwargs):
+        pass
+
+    def func_2(arg_3: int = None, **kwargs):
+        pass
+
+    func_1 = copy_signatures(func_1, [template])
+    func_2 = copy_signatures(func_2, [template], exclude_args=['arg_1'])
+    assert list(signature(func_1).parameters) == ['arg_1', 'arg_2', 'kwargs']
+    assert list(signature(func_2).parameters) == ['arg_2', 'kwargs']
+
+
+def test_copy_signatures__call_args():
+    def template(arg_1: str, arg_2: bool = False, arg_3: int = None):
+        pass
+
+    def func(**kwargs):
+        return kwargs
+
+    func = copy_signatures(func, [template])
+    assert func('a') == {'arg_1': 'a', 'arg_2': False, 'arg_3': None}
+    assert func('a', True, arg_4=4) == {'arg_1': 'a', 'arg_2': True, 'arg_3': None, 'arg_4': 4}
+    assert func(arg_3=3, arg_1='a') == {'arg_1': 'a', 'arg_2': False, 'arg_3': 3}
+
+    with pytest.raises(TypeError):
+        func()
+    with pytest.raises(TypeError):
+        func('a', arg_1='a')
+    with pytest.raises(TypeError):
+        func('a', True, 3, 4)
@@ -158,7 +158,7 @@ def test_get_access_token__invalid_creds(mock_get_jwt, requests_mock):
 # -------------------------
 
 
-@patch('pyinaturalist.auth.get_password', side_effect=list(MOCK_CREDS_OAUTH.values()))
+@patch('keyring.get_password', side_effect=list(MOCK_CREDS_OAUTH.values()))
 def test_get_keyring_credentials(get_password):
     assert get_keyring_credentials() == MOCK_CREDS_OAUTH
 
@@ -168,7 +168,7 @@ def test_get_keyring_credentials__not_installed():
     pass
 
 
-@patch('pyinaturalist.auth.get_password', side_effect=KeyringError)
+@patch('keyring.get_password', side_effect=KeyringError)
 def test_get_keyring_credentials__no_backend(get_password):
     assert get_keyring_credentials() == {}
 
@@ -177,7 +177,7 @@ def test_get_keyring_credentials__no_backend(get_password):
 # -------------------------
 
 
-@patch('pyinaturalist.auth.set_password')
+@patch('keyring.set_password')
 def test_set_keyring_credentials(set_password):
     set_keyring_credentials('username', 'password', 'app_id', 'app_secret')
     assert set_password.call_count == 4
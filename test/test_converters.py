@@ -1,12 +1,16 @@
+from copy import deepcopy
 from datetime import datetime
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from unittest.mock import MagicMock
 
 import pytest
-from dateutil.tz import tzoffset
+from dateutil.tz import tzoffset, tzutc
 
 from pyinaturalist.converters import (
+    convert_all_coordinates,
+    convert_all_results,
+    convert_all_timestamps,
     convert_lat_long,
     convert_observation_histogram,
     convert_observation_timestamps,
@@ -16,6 +20,7 @@ from pyinaturalist.converters import (
     format_file_size,
     format_license,
     safe_split,
+    try_datetime,
 )
 from test.conftest import load_sample_data
 
@@ -38,6 +43,30 @@ def test_convert_lat_long(input, expected_output):
     assert convert_lat_long(input) == expected_output
 
 
+def test_convert_all_coordinates():
+    results = [
+        {'latitude': '1234.5', 'longitude': '6789.0'},
+        {'location': '1234.5,6789.0'},
+        {'record': {'location': '1234.5,6789.0'}},
+        {'location': None},
+    ]
+    assert convert_all_coordinates(results) == [
+        {'latitude': 1234.5, 'longitude': 6789.0},
+        {'location': [1234.5, 6789.0]},
+        {'record': {'location': [1234.5, 6789.0]}},
+        {'location': None},
+    ]
+
+
+def test_convert_all_results():
+    """Converting results in one pass should be equivalent to converting them separately"""
+    results = load_sample_data('get_observations_node_page1.json')['results']
+    expected = convert_all_timestamps(convert_all_coordinates(deepcopy(results)))
+    assert convert_all_results(deepcopy(results)) == expected
+    assert isinstance(expected[0]['location'][0], float)
+    assert isinstance(expected[0]['created_at'], datetime)
+
+
 def test_ensure_file_obj__obj():
     file_obj = ensure_file_obj(BytesIO(b'test content'))
     assert file_obj.read() == b'test content'
@@ -170,3 +199,20 @@ def test_format_license():
 @pytest.mark.parametrize('input, expected_output', [(None, []), ('a | b', ['a', 'b'])])
 def test_safe_split(input, expected_output):
     assert safe_split(input) == expected_output
+
+
+@pytest.mark.parametrize(
+    'input, expected_output',
+    [
+        (None, None),
+        ('', None),
+        ('invalid', None),
+        ('2018-09-05', datetime(2018, 9, 5)),
+        ('2018-09-05T14:06:00+02:00', datetime(2018, 9, 5, 14, 6, tzinfo=tzoffset(None, 7200))),
+        ('2018-09-05T12:06:00.000Z', datetime(2018, 9, 5, 12, 6, tzinfo=tzutc())),
+        ('2018/09/05 2:06 PM', datetime(2018, 9, 5, 14, 6)),
+        ('2018-09-05 2:06 PM', datetime(2018, 9, 5, 14, 6)),
+    ],
+)
+def test_try_datetime(input, expected_output):
+    assert try_datetime(input) == expected_output
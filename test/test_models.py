@@ -38,6 +38,18 @@ def test_from_json():
     assert Observation.from_json(obs) is obs
 
 
+def test_from_json__invalid_attrs():
+    obs = Observation.from_json({'id': 1, 'invalid_attr': 'value', 'time_observed_at': None})
+    assert obs.id == 1
+    assert not hasattr(obs, 'invalid_attr')
+
+    # Temporary init-only attributes should be accepted, and valid attributes should be computed
+    # separately for each model class
+    annotation = Annotation.from_json({'controlled_attribute_id': 1, 'controlled_value_id': 2})
+    assert annotation.controlled_attribute.id == 1
+    assert annotation.controlled_value.id == 2
+
+
 def test_from_json_file():
     obs_list = Observation.from_json_file(sample_data_path('get_observations_node_page1.json'))
     assert isinstance(obs_list, list)
@@ -1,13 +1,17 @@
-from asyncio import get_event_loop
+import re
+from asyncio import gather, get_event_loop, get_running_loop
 from copy import deepcopy
+from datetime import datetime
+from threading import Event, current_thread
 from unittest.mock import patch
 
 import pytest
 
 from pyinaturalist.constants import API_V1
-from pyinaturalist.models import Observation
-from pyinaturalist.paginator import Paginator, WrapperPaginator
-from pyinaturalist.v1 import get_observations
+from pyinaturalist.models import Observation, Taxon
+from pyinaturalist.paginator import IDPaginator, Paginator, WrapperPaginator, paginate_iter
+from pyinaturalist.session import thread_local
+from pyinaturalist.v1 import get_observations, get_taxa_by_id
 from test.sample_data import SAMPLE_DATA
 
 
@@ -113,6 +117,129 @@ async def test_async_all(requests_mock):
     assert len(observations) == 2
 
 
+@pytest.mark.asyncio
+async def test_async_all__concurrent(requests_mock):
+    """After the first page, all remaining pages should be requested by page number"""
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_node_page1'])
+    page_1['total_results'] = 10
+
+    def get_page(request, context):
+        return {**page_1, 'results': page_1['results'] * int(request.qs['per_page'][0])}
+
+    requests_mock.get(f'{API_V1}/observations', json=get_page, status_code=200)
+
+    paginator = Paginator(get_observations, Observation, per_page=2, limit=5)
+    observations = await paginator.async_all()
+    assert len(observations) == 5
+    assert paginator.results_fetched == 5
+    assert paginator.exhausted is True
+
+    # The last page should only request as many results as are needed to reach the limit
+    requests = sorted(requests_mock.request_history, key=lambda r: int(r.qs['page'][0]))
+    assert [int(r.qs['page'][0]) for r in requests] == [1, 2, 3]
+    assert [int(r.qs['per_page'][0]) for r in requests] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_async_all__custom_pagination_kwargs(requests_mock):
+    """Concurrently fetched pages should use the same extra pagination params as the first page"""
+
+    class CustomPaginator(Paginator):
+        def _get_pagination_kwargs(self):
+            return {**super()._get_pagination_kwargs(), 'order_by': 'observed_on'}
+
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_node_page1'])
+    page_1['total_results'] = 3
+    requests_mock.get(f'{API_V1}/observations', json=page_1, status_code=200)
+
+    await CustomPaginator(get_observations, Observation, per_page=1).async_all()
+    assert len(requests_mock.request_history) == 3
+    for request in requests_mock.request_history:
+        assert request.qs['order_by'] == ['observed_on']
+        assert request.qs['per_page'] == ['1']
+
+
+@pytest.mark.asyncio
+@patch('pyinaturalist.session.get_local_session')
+async def test_async_all__shared_session(mock_get_local_session):
+    """Worker threads should reuse the current thread's session"""
+    session = mock_get_local_session.return_value
+    paginator = Paginator(get_observations, Observation)
+
+    with paginator._executor(2) as executor:
+        loop = get_running_loop()
+        worker_sessions = await gather(
+            *[loop.run_in_executor(executor, lambda: thread_local.session) for _ in range(4)]
+        )
+    assert all(s is session for s in worker_sessions)
+
+
+@pytest.mark.asyncio
+async def test_async_all__id_batches(requests_mock):
+    """All ID batches are known in advance, so they should all be requested"""
+    requests_mock.get(re.compile(f'{API_V1}/taxa/.+'), json=SAMPLE_DATA['get_taxa_by_id'])
+    paginator = IDPaginator(get_taxa_by_id, Taxon, ids=range(1, 8), ids_per_request=3)
+    taxa = await paginator.async_all()
+    assert len(taxa) == 3
+    assert paginator.exhausted is True
+    assert len(requests_mock.request_history) == 3
+
+
+def test_paginate_iter(requests_mock):
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'json': SAMPLE_DATA['get_observations_node_page1'], 'status_code': 200},
+            {'json': SAMPLE_DATA['get_observations_node_page2'], 'status_code': 200},
+        ],
+    )
+
+    results = paginate_iter(get_observations, method='id', id=[57754375, 57707611], per_page=1)
+    first_result = next(results)
+    assert isinstance(first_result['created_at'], datetime)
+
+    assert [r['id'] for r in results] == [57707611]
+    assert len(requests_mock.request_history) == 2
+    assert requests_mock.request_history[1].qs['id_above'] == ['57754375']
+
+
+def test_iter__prefetch(requests_mock):
+    """After the first page, each next page should be requested from a separate thread"""
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_node_page1'])
+    page_1['total_results'] = 3
+    requests_mock.get(f'{API_V1}/observations', json=page_1, status_code=200)
+    request_threads = []
+
+    def request_function(**kwargs):
+        request_threads.append(current_thread())
+        return get_observations(**kwargs)
+
+    results = list(Paginator(request_function, Observation, per_page=1))
+    assert len(results) == 3
+    assert request_threads[0] is current_thread()
+    assert all(thread is not current_thread() for thread in request_threads[1:])
+
+
+def test_iter__stop_early(requests_mock):
+    """Stopping iteration early should not wait for a prefetched page to finish"""
+    page_1 = deepcopy(SAMPLE_DATA['get_observations_node_page1'])
+    page_1['total_results'] = 3
+    requests_mock.get(f'{API_V1}/observations', json=page_1, status_code=200)
+    release = Event()
+
+    def request_function(**kwargs):
+        if kwargs['page'] > 1:
+            release.wait(timeout=5)
+        return get_observations(**kwargs)
+
+    start = datetime.now()
+    for _ in Paginator(request_function, Observation, per_page=1):
+        break
+    elapsed = (datetime.now() - start).total_seconds()
+    release.set()
+    assert elapsed < 1
+
+
 def test_count(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations?per_page=0', json={'results': [], 'total_results': 50}
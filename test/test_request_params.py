@@ -9,6 +9,7 @@ from pyinaturalist.request_params import (
     convert_datetime_params,
     convert_list_params,
     convert_observation_field_params,
+    convert_observation_params,
     convert_pagination_params,
     get_interval_ranges,
     preprocess_request_body,
@@ -71,6 +72,18 @@ def test_convert_observation_fields():
     ]
 
 
+def test_convert_observation_params__photos():
+    """Photos passed with either param name should be combined without modifying the originals"""
+    local_photos = []
+    photos = ['photo_1.jpg', 'photo_2.jpg']
+    params = {'local_photos': local_photos, 'photos': photos}
+    combined_photos, _, _, _, _ = convert_observation_params(params)
+
+    assert combined_photos == ['photo_1.jpg', 'photo_2.jpg']
+    assert local_photos == []
+    assert photos == ['photo_1.jpg', 'photo_2.jpg']
+
+
 def test_convert_pagination_params():
     params = convert_pagination_params({'per_page': 100})
     assert params['per_page'] == 100
@@ -5,10 +5,12 @@ from unittest.mock import patch
 import pytest
 import urllib3.util.retry
 from requests import Request
-from requests_ratelimiter import Limiter, RequestRate
+from requests_ratelimiter import Limiter, MemoryQueueBucket, RequestRate
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPSConnectionPool
 from urllib3.exceptions import MaxRetryError
 
-from pyinaturalist.constants import CACHE_EXPIRATION
+from pyinaturalist.constants import CACHE_EXPIRATION, MAX_DELAY, POOL_CONNECTIONS, POOL_MAXSIZE
 from pyinaturalist.session import (
     CACHE_FILE,
     MOCK_RESPONSE,
@@ -18,6 +20,7 @@ from pyinaturalist.session import (
     get,
     get_local_session,
     get_refresh_params,
+    logger,
     post,
     put,
 )
@@ -30,7 +33,8 @@ from pyinaturalist.session import (
 )
 @patch('pyinaturalist.session.format_response')
 @patch('pyinaturalist.session.Session.send')
-def test_http_methods(mock_send, mock_format, http_func, http_method):
+@patch('pyinaturalist.session.ClientSession._validate_json')
+def test_http_methods(mock_validate_json, mock_send, mock_format, http_func, http_method):
     http_func('https://url', key='value', session=None)
     request_obj = mock_send.call_args[0][0]
 
@@ -41,13 +45,28 @@ def test_http_methods(mock_send, mock_format, http_func, http_method):
 
 @patch('pyinaturalist.session.format_response')
 @patch('pyinaturalist.session.Session.send')
-def test_request_headers(mock_send, mock_format):
+@patch('pyinaturalist.session.ClientSession._validate_json')
+def test_request_headers(mock_validate_json, mock_send, mock_format):
     """Test that the request() wrapper passes along expected headers"""
     ClientSession().request('GET', 'https://url', access_token='token')
     request_obj = mock_send.call_args[0][0]
     assert request_obj.headers['Authorization'] == 'Bearer token'
 
 
+@patch('pyinaturalist.session.format_request')
+@patch('pyinaturalist.session.format_response')
+@patch('pyinaturalist.session.Session.send')
+@patch('pyinaturalist.session.ClientSession._validate_json')
+def test_request__logging_disabled(
+    mock_validate_json, mock_send, mock_format_response, mock_format_request
+):
+    """Request and response details should only be formatted if they will be logged"""
+    with patch.object(logger, 'isEnabledFor', return_value=False):
+        ClientSession().request('GET', 'https://url')
+    mock_format_request.assert_not_called()
+    mock_format_response.assert_not_called()
+
+
 # Test relevant combinations of dry-run settings and HTTP methods
 @pytest.mark.parametrize(
     'enabled_env, write_only_env, method, expected_real_request',
@@ -132,8 +151,11 @@ def test_request_validate_json__retry_failure(mock_sleep, requests_mock):
     )
 
     # Expect a MaxRetryError after exhausing retries
+    # (with a separate rate limit high enough that retries aren't delayed)
     retries = 7
-    session = ClientSession(max_retries=retries)
+    session = ClientSession(
+        max_retries=retries, per_second=retries + 1, bucket_class=MemoryQueueBucket
+    )
     with pytest.raises(MaxRetryError) as e:
         session.get('http://url/invalid_json')
         assert 'JSONDecodeError' in str(e.value)
@@ -185,6 +207,14 @@ def test_session__custom_expiration():
     assert session.settings.urls_expire_after['api.inaturalist.org/v*/taxa*'] == 3600
     assert session.settings.urls_expire_after['*'] == CACHE_EXPIRATION['*']
 
+    # User-provided URL patterns should be matched before the default patterns
+    assert list(session.settings.urls_expire_after)[:2] == [
+        'custom-domain/*',
+        'api.inaturalist.org/v*/taxa*',
+    ]
+    assert session.settings.urls_expire_after is not CACHE_EXPIRATION
+    assert 'custom-domain/*' not in CACHE_EXPIRATION
+
 
 def test_session__custom_retry():
     session = ClientSession(per_second=5)
@@ -192,9 +222,54 @@ def test_session__custom_retry():
     assert per_second_rate.limit / per_second_rate.interval == 5
 
 
+def test_session__connection_pool():
+    session = ClientSession()
+    adapter = session.get_adapter('https://api.inaturalist.org')
+    assert adapter._pool_connections == POOL_CONNECTIONS
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+    assert adapter.max_retries is session.retries
+
+
+def test_session__retries():
+    session = ClientSession(max_retries=3)
+    assert session.retries.total == 3
+    assert 429 in session.retries.status_forcelist
+    assert session.retries.respect_retry_after_header is True
+
+
+def test_session__retries__rate_limited(requests_mock):
+    """A rate-limited request retried by urllib3 should also fill the session's limiter bucket"""
+    url = 'https://api.inaturalist.org/v1/observations'
+    requests_mock.get(url, json={}, status_code=200)
+    session = ClientSession(bucket_class=MemoryQueueBucket)
+    with session.cache_disabled():
+        session.get(url)
+    bucket = session.limiter.bucket_group['api.inaturalist.org']
+    assert bucket.size() == 1
+
+    pool = HTTPSConnectionPool('api.inaturalist.org', port=443)
+    retries = session.retries.increment(
+        'GET', '/v1/observations', response=HTTPResponse(status=429), _pool=pool
+    )
+    assert bucket.size() == session.limiter._rates[0].limit
+    assert retries.on_rate_limit == session.retries.on_rate_limit
+
+
+def test_session__retries__retry_after():
+    """A Retry-After delay from the server should be capped at MAX_DELAY"""
+    session = ClientSession()
+    response = HTTPResponse(status=429, headers={'Retry-After': str(MAX_DELAY * 10)})
+    assert session.retries.get_retry_after(response) == MAX_DELAY
+
+    response = HTTPResponse(status=429, headers={'Retry-After': '5'})
+    assert session.retries.get_retry_after(response) == 5
+    assert session.retries.get_retry_after(HTTPResponse(status=429)) is None
+
+
 @patch('requests.sessions.Session.send')
 @patch('requests_ratelimiter.requests_ratelimiter.Limiter')
-def test_session__send(mock_limiter, mock_requests_send):
+@patch('pyinaturalist.session.ClientSession._validate_json')
+def test_session__send(mock_validate_json, mock_limiter, mock_requests_send):
     session = ClientSession()
     request = Request(method='GET', url='http://test.com').prepare()
     session.send(request)
@@ -1,10 +1,12 @@
 # flake8: noqa: F405
+import re
 from datetime import datetime
 from io import BytesIO
 from unittest.mock import patch
 
 import pytest
 from dateutil.tz import tzoffset, tzutc
+from requests import Session
 
 from pyinaturalist.constants import API_V1
 from pyinaturalist.exceptions import ObservationNotFound
@@ -29,7 +31,7 @@ from test.sample_data import SAMPLE_DATA, j_taxon_summary_1_conserved, j_taxon_s
 
 def test_get_observation(requests_mock):
     requests_mock.get(
-        f'{API_V1}/observations',
+        f'{API_V1}/observations/16227955',
         json=SAMPLE_DATA['get_observation'],
         status_code=200,
     )
@@ -97,6 +99,19 @@ def test_get_observations__all_pages(requests_mock):
     assert len(observations['results']) == 2
 
 
+def test_get_observations__only_id(requests_mock):
+    """Results with only IDs should be returned without any added (empty) fields"""
+    requests_mock.get(
+        f'{API_V1}/observations',
+        json={'total_results': 2, 'page': 1, 'per_page': 2, 'results': [{'id': 1}, {'id': 2}]},
+        status_code=200,
+    )
+
+    observations = get_observations(only_id=True)
+    assert 'only_id=true' in requests_mock.last_request.url
+    assert observations['results'] == [{'id': 1}, {'id': 2}]
+
+
 def test_get_observations_by_id(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/493595',
@@ -128,9 +143,28 @@ def test_get_observations_by_id__multiple(requests_mock):
     assert observations['total_results'] == len(observations['results']) == 2
 
 
+def test_get_observations_by_id__batched(requests_mock):
+    """More than IDS_PER_REQUEST IDs should be split into multiple requests"""
+    requests_mock.get(
+        re.compile(f'{API_V1}/observations/.+'),
+        json=SAMPLE_DATA['get_observations_by_id'],
+        status_code=200,
+    )
+
+    observations = get_observations_by_id(list(range(1, 36)))
+    assert observations['results'][0]['observed_on'] == datetime(
+        2018, 9, 5, 14, 6, tzinfo=tzoffset(None, 7200)
+    )
+    requested_urls = [r.url for r in requests_mock.request_history]
+    assert requested_urls == [
+        f'{API_V1}/observations/{",".join(map(str, range(1, 31)))}',
+        f'{API_V1}/observations/31,32,33,34,35',
+    ]
+
+
 def test_get_observation__non_existent(requests_mock):
     requests_mock.get(
-        f'{API_V1}/observations',
+        f'{API_V1}/observations/99999999',
         json=SAMPLE_DATA['get_nonexistent_observation'],
         status_code=200,
     )
@@ -378,6 +412,74 @@ def test_upload(requests_mock):
     assert response[1]['sound']['file_content_type'] == 'audio/mpeg'
 
 
+@patch('pyinaturalist.v1.observations.get_thread_pool')
+def test_upload__single_file(mock_get_thread_pool, requests_mock):
+    """A single file should be uploaded directly, without starting a worker thread"""
+    requests_mock.post(
+        f'{API_V1}/observation_photos',
+        json=SAMPLE_DATA['post_observation_photos'],
+        status_code=200,
+    )
+
+    response = upload(1234, BytesIO(), access_token='token')
+    assert response[0]['photo']['native_username'] == 'username'
+    mock_get_thread_pool.assert_not_called()
+
+
+def test_upload__multiple_files(requests_mock):
+    requests_mock.post(
+        f'{API_V1}/observation_photos',
+        json=SAMPLE_DATA['post_observation_photos'],
+        status_code=200,
+    )
+    requests_mock.post(
+        f'{API_V1}/observation_sounds',
+        json=SAMPLE_DATA['post_observation_sounds'],
+        status_code=200,
+    )
+
+    photos = [BytesIO() for _ in range(3)]
+    sounds = [BytesIO() for _ in range(2)]
+    response = upload(1234, photos, sounds, access_token='token')
+    assert len(requests_mock.request_history) == 5
+
+    # Responses should be in the same order as the files
+    assert all('photo' in r for r in response[:3])
+    assert all('sound' in r for r in response[3:])
+
+
+def test_upload__photo_order(requests_mock):
+    """Photos should be uploaded in order, since the first photo is the observation's default"""
+    requests_mock.post(
+        f'{API_V1}/observation_photos',
+        json=SAMPLE_DATA['post_observation_photos'],
+        status_code=200,
+    )
+    requests_mock.post(
+        f'{API_V1}/observation_sounds',
+        json=SAMPLE_DATA['post_observation_sounds'],
+        status_code=200,
+    )
+
+    photos = [BytesIO(f'photo_{i}'.encode()) for i in range(5)]
+    sounds = [BytesIO(f'sound_{i}'.encode()) for i in range(2)]
+    upload(1234, photos, sounds, access_token='token')
+
+    photo_requests = [r for r in requests_mock.request_history if 'photo' in r.url]
+    assert len(photo_requests) == 5
+    for i, request in enumerate(photo_requests):
+        assert f'photo_{i}'.encode() in request.body
+
+
+@patch('pyinaturalist.v1.observations.post')
+def test_upload__session(mock_post):
+    """A session passed to upload() should be used as-is for each file, not copied"""
+    session = Session()
+    upload(1234, [BytesIO(), BytesIO()], BytesIO(), access_token='token', session=session)
+    assert mock_post.call_count == 3
+    assert all(call.kwargs['session'] is session for call in mock_post.call_args_list)
+
+
 @patch('pyinaturalist.v1.observations.update_observation')
 def test_upload__with_photo_ids(mock_update_observation):
     upload(1234, access_token='token', photo_ids=[5678])
@@ -1,3 +1,6 @@
+import re
+from copy import deepcopy
+
 import pytest
 
 from pyinaturalist.constants import API_V1
@@ -23,6 +26,33 @@ def test_get_places_by_id(requests_mock):
     assert len(result['ancestor_place_ids']) == 4
 
 
+def test_get_places_by_id__batched(requests_mock):
+    """More than IDS_PER_REQUEST IDs should be split into multiple requests, with coordinates
+    converted for each batch
+    """
+    batch_1 = deepcopy(SAMPLE_DATA['get_places_by_id'])
+    batch_2 = deepcopy(SAMPLE_DATA['get_places_by_id'])
+    for result in batch_2['results']:
+        result['id'] += 1000000
+    requests_mock.get(
+        re.compile(f'{API_V1}/places/.+'),
+        [{'json': batch_1, 'status_code': 200}, {'json': batch_2, 'status_code': 200}],
+    )
+
+    response = get_places_by_id(list(range(1, 36)))
+    requested_urls = [r.url for r in requests_mock.request_history]
+    assert requested_urls == [
+        f'{API_V1}/places/{",".join(map(str, range(1, 31)))}',
+        f'{API_V1}/places/31,32,33,34,35',
+    ]
+
+    assert response['total_results'] == len(response['results']) == 4
+    for result in response['results']:
+        assert all(isinstance(coord, float) for coord in result['location'])
+    assert response['results'][0]['location'] == [-29.665119, 17.88583]
+    assert response['results'][2]['location'] == [-29.665119, 17.88583]
+
+
 @pytest.mark.parametrize('place_id', ['asdf', [None], [1, 'not a number']])
 def test_get_places_by_id__invalid_inputs(place_id):
     with pytest.raises(ValueError):
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import patch
 from urllib.parse import urlencode
 
@@ -72,6 +73,25 @@ def test_get_taxa_by_id(requests_mock):
     assert len(result['ancestors']) == 12
 
 
+def test_get_taxa_by_id__batched(requests_mock):
+    """More than IDS_PER_REQUEST IDs should be split into multiple requests"""
+    taxon_ids = list(range(1, 36))
+    requests_mock.get(
+        re.compile(f'{API_V1}/taxa/.+'),
+        json=load_sample_data('get_taxa_by_id.json'),
+        status_code=200,
+    )
+
+    response = get_taxa_by_id(taxon_ids)
+    assert response['total_results'] == len(response['results']) == 2
+    requested_urls = [r.url for r in requests_mock.request_history]
+    assert requested_urls == [
+        f'{API_V1}/taxa/{",".join(map(str, range(1, 31)))}',
+        f'{API_V1}/taxa/31,32,33,34,35',
+    ]
+    assert response['results'][0]['id'] == 70118
+
+
 @pytest.mark.parametrize('taxon_id', ['asdf', [None], [1, 'not a number']])
 def test_get_taxa_by_id__invalid_inputs(taxon_id):
     with pytest.raises(ValueError):